@@ -1,8 +1,9 @@
-import requests
-import json
+import atexit
+import httpx
+import orjson
 import os
 import time
-import pandas as pd
+import threading
 import numpy as np
 import streamlit as st
 from streamlit_option_menu import option_menu
@@ -13,10 +14,99 @@ from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import re
+from operator import itemgetter
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Streamlit re-executes this script on every interaction, so one-time setup
+# is memoized with st.cache_resource and survives reruns
+
+@st.cache_resource(show_spinner=False)
+def _env():
+    """
+    Load environment variables and return the API keys
+    """
+    load_dotenv()
+    return {
+        "rapid": os.getenv("RAPID_API_KEY"),
+        "cohere": os.getenv("COHERE_API_KEY"),
+        "anyscale": os.getenv("ANYSCALE_API_KEY"),
+    }
+
+@st.cache_resource(show_spinner=False)
+def _http_client():
+    """
+    Shared HTTP/2 client so calls to the same host are multiplexed over pooled connections
+    """
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32)
+    )
+    return httpx.Client(
+        transport=transport,
+        # Fail fast on unreachable hosts; bound the wait for each response read
+        timeout=httpx.Timeout(15.0, connect=3.05),
+        headers={"Content-Type": "application/json"}
+    )
+
+CLIENT = _http_client()
+
+RAPID_API_HOST = "fresh-linkedin-profile-data.p.rapidapi.com"
+
+# Input validation, checked before any paid API call or browser session
+# Scheme and subdomain (www., m. or a country code like in./uk.) are optional
+LI_PROFILE_RE = re.compile(r"^(https?://)?([a-z]{1,3}\.|www\.)?linkedin\.com/in/[\w\-%]+/?(\?.*)?$",
+                           re.IGNORECASE)
+LI_POST_RE = re.compile(r"^(https?://)?([a-z]{1,3}\.|www\.)?linkedin\.com/(posts|feed/update)/[\w\-%/:]+(\?.*)?$",
+                        re.IGNORECASE)
+LI_USERNAME_RE = re.compile(r"^[\w\-%]+$")
+
+# One record per post: URL plus engagement counts
+POST_DTYPE = np.dtype([
+    ('Post URL', object),
+    ('Number of Likes', 'i4'),
+    ('Number of Comments', 'i4'),
+    ('Number of Reposts', 'i4'),
+])
+
+# RapidAPI post fields in POST_DTYPE order, with defaults for missing keys
+POST_DEFAULTS = {'post_url': '', 'num_likes': 0, 'num_comments': 0, 'num_reposts': 0}
+POST_FIELDS = itemgetter(*POST_DEFAULTS)
+
+PROFILE_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an AI assistant analyzing LinkedIn profiles. Provide insights about career progression, skills, and professional background. Compare with industry standards and suggest potential opportunities or gaps."
+}
+
+INSIGHT_TMPL = (
+    "📈 Most Engaging Post: {url}\n\n"
+    "👍 Received {likes:,} likes\n\n"
+    "💬 Generated {comments:,} comments\n\n"
+    "🔄 Earned {reposts:,} reposts\n\n"
+    "📊 Average likes per post: {avg_likes:.1f}\n\n"
+    "💡 Engagement rate: {rate:.1f} interactions per post"
+)
+
+MENU_OPTIONS = ["My Profile", "Post Analyzer", "Competitor Analysis"]
+
+MENU_STYLES = {
+    "container": {"padding": "5!important"},
+    "icon": {"color": "#000", "font-size": "25px"},
+    "nav-link": {
+        "font-size": "16px",
+        "text-align": "left",
+        "margin": "0px",
+        "--hover-color": "#0087FF"
+    },
+    "nav-link-selected": {"background-color": "#0087FF"},
+}
+
+FOOTER_CSS = """
+    <style>
+        footer {visibility: hidden;}
+        .stDeployButton {display:none;}
+    </style>
+"""
 
 # Page configuration
 st.set_page_config(
@@ -25,22 +115,158 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-def scrapeposts(purl):
+# Cached API calls: repeated queries for the same input are served from memory
+# for an hour instead of re-issuing the paid request
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_posts(purl):
     """
-    Scrape and analyze LinkedIn posts for the given profile URL
+    Fetch the raw post list for the given profile URL from RapidAPI
     """
-    api_url = "https://fresh-linkedin-profile-data.p.rapidapi.com/get-profile-posts"
+    api_url = f"https://{RAPID_API_HOST}/get-profile-posts"
     querystring = {"linkedin_url": purl, "type": "posts"}
     headers = {
-        "X-RapidAPI-Key": os.getenv("RAPID_API_KEY"),
-        "X-RapidAPI-Host": "fresh-linkedin-profile-data.p.rapidapi.com"
+        "X-RapidAPI-Key": _env()["rapid"],
+        "X-RapidAPI-Host": RAPID_API_HOST
     }
+    api_res = CLIENT.get(api_url, headers=headers, params=querystring)
+    api_res.raise_for_status()
+    return orjson.loads(api_res.content)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _extract_post(post_url, _api_key):
+    """
+    Extract the text content of a LinkedIn post
+    """
+    payload = {
+        "input": post_url,
+        "input_type": "article",
+        "output_type": "json",
+        "steps": [{"skill": "html-extract-article"}],  # Example of extracting article content
+    }
+    # Making the request to the extraction API (you can replace this step with actual post content extraction logic)
+    response = CLIENT.post("https://api.oneai.com/api/v0/pipeline", json=payload,
+                           headers={"Authorization": f"Bearer {_api_key}"})
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+# Streamed generation calls: text chunks are yielded as they arrive so the
+# analysis can be rendered before the full completion is ready
+def _stream_cohere(article_text, api_key):
+    """
+    Yield generated insight chunks for the given post text from Cohere
+    """
+    cohere_payload = {
+        "model": "xlarge",  # You can choose the model based on your needs, for example, 'xlarge' or 'large'
+        "prompt": f"Analyze this LinkedIn post and provide insights: {article_text}",
+        "max_tokens": 500,
+        "temperature": 0.7,
+        "stream": True
+    }
+    with CLIENT.stream("POST", "https://api.cohere.ai/v1/generate", json=cohere_payload,
+                       headers={"Authorization": f"Bearer {api_key}"}) as response:
+        response.raise_for_status()
+        # Cohere streams one JSON object per line
+        for line in response.iter_lines():
+            if not line:
+                continue
+            event = orjson.loads(line)
+            if event.get("is_finished"):
+                break
+            if event.get("text"):
+                yield event["text"]
+
+def _stream_anyscale(profile_text, api_key):
+    """
+    Yield generated insight chunks for the given profile text from Anyscale
+    """
+    api_base = "https://api.endpoints.anyscale.com/v1/chat/completions"
+    body = {
+        "model": "meta-llama/Llama-2-70b-chat-hf",
+        "messages": [
+            PROFILE_SYSTEM_MESSAGE,
+            {
+                "role": "user",
+                "content": f"Analyze this LinkedIn profile data and provide strategic insights:\n\n{profile_text}"
+            }
+        ],
+        "temperature": 0.7,
+        "max_tokens": 750,
+        "stream": True
+    }
+    with CLIENT.stream(
+        "POST",
+        api_base,
+        headers={"Authorization": f"Bearer {api_key}"},
+        content=orjson.dumps(body)
+    ) as response:
+        response.raise_for_status()
+        # Server-sent events: "data: {...}" lines terminated by "data: [DONE]"
+        for line in response.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            event = line[len("data:"):].strip()
+            if event == "[DONE]":
+                break
+            choices = orjson.loads(event).get("choices")
+            if choices and choices[0].get("delta", {}).get("content"):
+                yield choices[0]["delta"]["content"]
+
+def _render_stream(chunks, interval=0.05):
+    """
+    Render streamed text into one placeholder, redrawing at most every
+    `interval` seconds, and return the full text
+    """
+    placeholder = st.empty()
+    buf = []
+    last_draw = 0.0
+    for chunk in chunks:
+        buf.append(chunk)
+        now = time.monotonic()
+        if now - last_draw >= interval:
+            placeholder.markdown("".join(buf))
+            last_draw = now
+    text = "".join(buf)
+    placeholder.markdown(text)
+    return text
+
+@st.cache_resource(show_spinner=False)
+def _analysis_cache():
+    """
+    Finished AI analyses keyed by service and input text, with their expiry
+    time, plus the lock guarding them since every session shares the store
+    """
+    return threading.Lock(), {}
+
+def _cached_analysis(key, chunks, ttl=3600):
+    """
+    Show the analysis for `key` from the cache, or stream `chunks` into the
+    page and cache the finished text for `ttl` seconds; returns the text
+    """
+    lock, cache = _analysis_cache()
+    now = time.monotonic()
+    with lock:
+        hit = cache.get(key)
+    if hit and hit[0] > now:
+        st.markdown(hit[1])
+        return hit[1]
+    text = _render_stream(chunks)
+    if text:
+        with lock:
+            for stale in [k for k, (expires, _) in cache.items() if expires <= now]:
+                del cache[stale]
+            cache[key] = (now + ttl, text)
+    return text
+
+def scrapeposts(purl):
+    """
+    Scrape and analyze LinkedIn posts for the given profile URL
+    """
+    if not _env()["rapid"]:
+        st.error("RapidAPI key not found in environment variables")
+        return
     
     try:
-        api_res = requests.get(api_url, headers=headers, params=querystring, timeout=30)
-        api_res.raise_for_status()
-        
-        json_data = api_res.json()
+        json_data = _fetch_posts(purl)
         if not json_data.get('data'):
             st.error("No post data found for this profile")
             return
@@ -48,36 +274,45 @@ def scrapeposts(purl):
         data = json_data['data'][:10]  # Limit to first 10 post URLs
 
         # Extract data
-        post_urls = [item.get('post_url', '') for item in data]
-        num_likes = [item.get('num_likes', 0) for item in data]
-        num_comments = [item.get('num_comments', 0) for item in data]
-        num_reposts = [item.get('num_reposts', 0) for item in data]
+        posts = np.fromiter(
+            (POST_FIELDS({**POST_DEFAULTS, **item}) for item in data),
+            dtype=POST_DTYPE,
+            count=len(data)
+        )
+        post_urls = posts['Post URL']
+        num_likes = posts['Number of Likes']
+        num_comments = posts['Number of Comments']
+        num_reposts = posts['Number of Reposts']
+
+        total_likes = int(num_likes.sum())
+        total_comments = int(num_comments.sum())
+        total_reposts = int(num_reposts.sum())
+        total_impressions = total_likes + total_reposts
+        total_engagements = total_likes + total_comments + total_reposts
+
+        # Nothing to chart or rank for profiles without any engagement yet
+        if total_engagements == 0:
+            st.info("No engagement data yet for these posts.")
+            return
 
         # Display metrics
         st.divider()
         p1, p2, p3 = st.columns(3)
         with p1:
             st.write("Total Likes")
-            st.title(f"{sum(num_likes):,}")
+            st.title(f"{total_likes:,}")
             st.divider()
         with p2:
             st.write("Total Impressions")
-            total_impressions = sum(num_likes) + sum(num_reposts)
             st.title(f"{total_impressions:,}")
             st.divider()
         with p3:
             st.write("Total Engagements")
-            total_engagements = sum(num_likes) + sum(num_comments) + sum(num_reposts)
             st.title(f"{total_engagements:,}")
             st.divider()
 
-        # Create DataFrames
-        df = pd.DataFrame({
-            'Post URL': post_urls,
-            'Number of Likes': num_likes,
-            'Number of Comments': num_comments,
-            'Number of Reposts': num_reposts,
-        })
+        # Column views over the post records, handed straight to Streamlit
+        table = {name: posts[name] for name in POST_DTYPE.names}
 
         # Display visualizations
         st.subheader("Engagement Metrics Over Time")
@@ -86,49 +321,47 @@ def scrapeposts(purl):
         col1, col2 = st.columns(2)
         with col1:
             st.caption("Likes per Post")
-            st.bar_chart(data=df, y="Number of Likes")
+            st.bar_chart(data={"Number of Likes": num_likes}, y="Number of Likes")
         with col2:
             st.caption("Comments per Post")
-            st.bar_chart(data=df, y="Number of Comments")
+            st.bar_chart(data={"Number of Comments": num_comments}, y="Number of Comments")
         
         # Area chart for overall engagement
         st.subheader("Overall Engagement Trends")
-        chart_data = pd.DataFrame({
+        st.area_chart({
             "Likes": num_likes,
             "Comments": num_comments,
             "Reposts": num_reposts,
         })
-        st.area_chart(chart_data)
 
         # Display tables and insights
         st.title("Recent Posts Analysis")
-        st.dataframe(df, use_container_width=True)
+        st.dataframe(table, use_container_width=True)
         
         # Most engaging posts
         st.divider()
         st.subheader("Top Performing Posts")
-        df_sorted = df.sort_values('Number of Likes', ascending=False)
-        st.dataframe(df_sorted, use_container_width=True)
+        order = np.argsort(-num_likes, kind='stable')
+        # "Post #" keeps each post's original position, as shown in the charts above
+        st.dataframe({"Post #": order, **{name: column[order] for name, column in table.items()}},
+                     use_container_width=True, hide_index=True)
         
         # AI Insights
         st.divider()
         st.title("AI Insights")
-        top_post = df_sorted.iloc[0]
-        insights = [
-            f"📈 Most Engaging Post: {top_post['Post URL']}",
-            f"👍 Received {top_post['Number of Likes']:,} likes",
-            f"💬 Generated {top_post['Number of Comments']:,} comments",
-            f"🔄 Earned {top_post['Number of Reposts']:,} reposts",
-            f"📊 Average likes per post: {df['Number of Likes'].mean():.1f}",
-            f"💡 Engagement rate: {(total_engagements / len(data)):.1f} interactions per post"
-        ]
-        
-        for insight in insights:
-            st.markdown(insight)
+        top = int(np.argmax(num_likes))
+        st.markdown(INSIGHT_TMPL.format_map({
+            "url": post_urls[top],
+            "likes": num_likes[top],
+            "comments": num_comments[top],
+            "reposts": num_reposts[top],
+            "avg_likes": num_likes.mean(),
+            "rate": total_engagements / len(data),
+        }))
             
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         st.error(f"Failed to fetch post data: {str(e)}")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         st.error(f"Failed to parse API response: {str(e)}")
     except Exception as e:
         st.error(f"An unexpected error occurred: {str(e)}")
@@ -138,33 +371,14 @@ def analyze_post(post_url):
     Analyze a single LinkedIn post using Cohere API
     """
     # Extract API key from environment variables
-    cohere_api_key = os.getenv("COHERE_API_KEY")
+    cohere_api_key = _env()["cohere"]
     if not cohere_api_key:
         st.error("Cohere API key not found in environment variables")
         return
-        
-    # Define the Cohere API endpoint
-    url = "https://api.cohere.ai/v1/generate"
-    
-    headers = {
-        "Authorization": f"Bearer {cohere_api_key}",
-        "Content-Type": "application/json"
-    }
     
     try:
         # Extract post content (you can replace this step with actual post content scraping or processing)
-        payload = {
-            "input": post_url,
-            "input_type": "article",
-            "output_type": "json",
-            "steps": [{"skill": "html-extract-article"}],  # Example of extracting article content
-        }
-
-        # Making the request to the extraction API (you can replace this step with actual post content extraction logic)
-        response = requests.post("https://api.oneai.com/api/v0/pipeline", json=payload, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        article_data = response.json()
+        article_data = _extract_post(post_url, cohere_api_key)
         
         if not article_data.get('output'):
             st.error("Could not extract post content")
@@ -176,81 +390,156 @@ def analyze_post(post_url):
         # Now, analyze this content using Cohere's API
         st.info("Analyzing post content with Cohere...")
         
-        cohere_payload = {
-            "model": "xlarge",  # You can choose the model based on your needs, for example, 'xlarge' or 'large'
-            "prompt": f"Analyze this LinkedIn post and provide insights: {article_text}",
-            "max_tokens": 500,
-            "temperature": 0.7
-        }
-        
-        # Send the request to Cohere's API for analysis
-        cohere_response = requests.post(url, headers=headers, json=cohere_payload, timeout=30)
-        cohere_response.raise_for_status()
-        
-        cohere_data = cohere_response.json()
-        
-        if "text" in cohere_data:
-            analysis = cohere_data["text"]
-            st.subheader("AI Analysis")
-            st.markdown(analysis)
-        else:
+        st.subheader("AI Analysis")
+        # Stream Cohere's analysis into the page as it is generated, unless it is already cached
+        analysis = _cached_analysis(("cohere", article_text), _stream_cohere(article_text, cohere_api_key))
+        if not analysis:
             st.error("Invalid response format from Cohere API")
             
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         st.error(f"API request failed: {str(e)}")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         st.error(f"Failed to parse API response: {str(e)}")
     except Exception as e:
         st.error(f"An unexpected error occurred: {str(e)}")
 
+# Profile sections scraped for competitor analysis
+PROFILE_SECTIONS = {
+    "About": "section.artdeco-card div.display-flex span",
+    "Experience": "section#experience-section li.artdeco-list__item",
+    "Education": "section#education-section li.artdeco-list__item",
+    "Skills": "section.artdeco-card section.skill-categories-section span"
+}
+
+# Collects the text of every section in a single browser round trip;
+# a section whose selector fails comes back as null
+PROFILE_SECTIONS_JS = """
+const selectors = arguments[0];
+const out = {};
+for (const name in selectors) {
+    try {
+        out[name] = [...document.querySelectorAll(selectors[name])]
+            .map(e => e.innerText.trim())
+            .filter(Boolean);
+    } catch (e) {
+        out[name] = null;
+    }
+}
+return out;
+"""
+
+# Browsers left idle this long are quit, since Streamlit gives no hook for
+# when a session ends
+DRIVER_IDLE_TIMEOUT = 15 * 60
+
+def _quit_driver(driver):
+    """
+    Quit a driver, ignoring browsers that have already gone away
+    """
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+@st.cache_resource(show_spinner=False)
+def _driver_registry():
+    """
+    Last-use time of every live driver across all sessions; all of them are
+    quit when the server exits
+    """
+    registry = {}
+    atexit.register(lambda: [_quit_driver(driver) for driver in list(registry)])
+    return registry
+
+def _reap_idle_drivers():
+    """
+    Quit drivers, from any session, that have been idle for DRIVER_IDLE_TIMEOUT
+    """
+    registry = _driver_registry()
+    now = time.monotonic()
+    for driver, last_used in list(registry.items()):
+        if now - last_used > DRIVER_IDLE_TIMEOUT:
+            registry.pop(driver, None)
+            _quit_driver(driver)
+
+def _get_driver():
+    """
+    Return this session's headless Firefox driver, starting it on first use
+    or after it was quit for being idle
+    """
+    _reap_idle_drivers()
+    registry = _driver_registry()
+    driver = st.session_state.get("driver")
+    if driver is None or driver not in registry:
+        options = Options()
+        options.add_argument("-headless")
+        # Skip images and stylesheets, only the page text is scraped
+        options.set_preference("permissions.default.image", 2)
+        options.set_preference("permissions.default.stylesheet", 2)
+        options.set_preference("dom.ipc.processCount", 1)
+        driver = webdriver.Firefox(options=options)
+        st.session_state.driver = driver
+        st.session_state.pop("linkedin_user", None)
+    registry[driver] = time.monotonic()
+    return driver
+
+def _reset_driver():
+    """
+    Quit this session's driver so the next analysis starts from a clean browser
+    """
+    driver = st.session_state.pop("driver", None)
+    st.session_state.pop("linkedin_user", None)
+    if driver is not None:
+        _driver_registry().pop(driver, None)
+        _quit_driver(driver)
+
 def competitor_analysis(username, password, comp_un):
     """
     Analyze a competitor's LinkedIn profile
     """
     try:
-        options = Options()
-        options.headless = True
         furl = f'https://www.linkedin.com/in/{comp_un}?original_referer=https://google.com'
         
-        driver = webdriver.Firefox(options=options)
+        driver = _get_driver()
         wait = WebDriverWait(driver, 10)
         
-        # Login process
-        driver.get('https://www.linkedin.com/login')
-        
-        username_input = wait.until(EC.presence_of_element_located((By.ID, "username")))
-        username_input.send_keys(username)
-        
-        password_input = wait.until(EC.presence_of_element_located((By.ID, "password")))
-        password_input.send_keys(password)
-        
-        login_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']")))
-        login_button.click()
+        # Login process, only needed once per session and account
+        if st.session_state.get("linkedin_user") != username:
+            driver.get('https://www.linkedin.com/login')
+            
+            username_input = wait.until(EC.presence_of_element_located((By.ID, "username")))
+            username_input.send_keys(username)
+            
+            password_input = wait.until(EC.presence_of_element_located((By.ID, "password")))
+            password_input.send_keys(password)
+            
+            login_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']")))
+            login_button.click()
+            
+            # Wait for LinkedIn to redirect away from the login form
+            wait.until(EC.any_of(EC.url_contains("/feed"), EC.url_contains("checkpoint")))
+            if "/feed" not in driver.current_url:
+                st.error("LinkedIn asked for a security check on this account. "
+                         "Complete it in a regular browser and try again.")
+                _reset_driver()
+                return
+            st.session_state.linkedin_user = username
         
-        # Wait and navigate
-        time.sleep(3)
         driver.get(furl)
         
         # Extract profile data
         wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "main")))
         
         profile_data = []
-        sections = {
-            "About": "section.artdeco-card div.display-flex span",
-            "Experience": "section#experience-section li.artdeco-list__item",
-            "Education": "section#education-section li.artdeco-list__item",
-            "Skills": "section.artdeco-card section.skill-categories-section span"
-        }
+        sections = driver.execute_script(PROFILE_SECTIONS_JS, PROFILE_SECTIONS)
         
-        for section_name, selector in sections.items():
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                section_data = [element.text.strip() for element in elements if element.text.strip()]
-                if section_data:
-                    profile_data.append(f"\n{section_name}:")
-                    profile_data.extend(section_data)
-            except Exception as e:
-                st.warning(f"Could not extract {section_name} section: {str(e)}")
+        for section_name in PROFILE_SECTIONS:
+            section_data = sections.get(section_name)
+            if section_data is None:
+                st.warning(f"Could not extract {section_name} section")
+            elif section_data:
+                profile_data.append(f"\n{section_name}:")
+                profile_data.extend(section_data)
         
         if not profile_data:
             raise ValueError("No profile data could be extracted")
@@ -261,76 +550,37 @@ def competitor_analysis(username, password, comp_un):
         # AI Analysis
         st.info("Analyzing profile data...")
         
-        anyscale_token = os.getenv("ANYSCALE_API_KEY")
+        anyscale_token = _env()["anyscale"]
         if not anyscale_token:
             st.error("Anyscale API key not found in environment variables")
             return
-            
-        api_base = "https://api.endpoints.anyscale.com/v1/chat/completions"
-        body = {
-            "model": "meta-llama/Llama-2-70b-chat-hf",
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are an AI assistant analyzing LinkedIn profiles. Provide insights about career progression, skills, and professional background. Compare with industry standards and suggest potential opportunities or gaps."
-                },
-                {
-                    "role": "user",
-                    "content": f"Analyze this LinkedIn profile data and provide strategic insights:\n\n{profile_text}"
-                }
-            ],
-            "temperature": 0.7,
-            "max_tokens": 750
-        }
-        
-        response = requests.post(
-            api_base,
-            headers={
-                "Authorization": f"Bearer {anyscale_token}",
-                "Content-Type": "application/json"
-            },
-            json=body,
-            timeout=30
-        )
-        response.raise_for_status()
         
-        data = response.json()
-        if "choices" in data and data["choices"] and \
-           "message" in data["choices"][0] and \
-           "content" in data["choices"][0]["message"]:
-            analysis = data["choices"][0]["message"]["content"]
-            st.subheader("AI Analysis")
-            st.markdown(analysis)
-        else:
+        st.subheader("AI Analysis")
+        analysis = _cached_analysis(("anyscale", profile_text), _stream_anyscale(profile_text, anyscale_token))
+        if not analysis:
             st.error("Invalid response format from AI service")
             
+    except httpx.HTTPError as e:
+        st.error(f"API request failed: {str(e)}")
+    except orjson.JSONDecodeError as e:
+        st.error(f"Failed to parse API response: {str(e)}")
     except ValueError as e:
         st.error(str(e))
+        _reset_driver()
     except Exception as e:
         st.error(f"An error occurred: {str(e)}")
-    finally:
-        if 'driver' in locals():
-            driver.quit()
+        _reset_driver()
 
 # Sidebar navigation
 with st.sidebar:
     choose = option_menu(
         "DASHBOARD",
-        ["My Profile", "Post Analyzer", "Competitor Analysis"],
+        MENU_OPTIONS,
         icons=['linkedin', 'file-post', 'kanban'],
         menu_icon="list",
         default_index=0,
-        styles={
-            "container": {"padding": "5!important"},
-            "icon": {"color": "#000", "font-size": "25px"},
-            "nav-link": {
-                "font-size": "16px",
-                "text-align": "left",
-                "margin": "0px",
-                "--hover-color": "#0087FF"
-            },
-            "nav-link-selected": {"background-color": "#0087FF"},
-        }
+        key="dash_menu",
+        styles=MENU_STYLES
     )
 
 # Main content area
@@ -344,8 +594,10 @@ if choose == "My Profile":
     if st.button("Analyze Profile"):
         if not purl:
             st.error("Please enter a LinkedIn profile URL")
+        elif not LI_PROFILE_RE.match(purl.strip()):
+            st.error("Please enter a valid LinkedIn profile URL, e.g. https://www.linkedin.com/in/yourprofile")
         else:
-            scrapeposts(purl)
+            scrapeposts(purl.strip())
 
 elif choose == "Post Analyzer":
     st.title("LinkedIn Post Analyzer")
@@ -357,8 +609,10 @@ elif choose == "Post Analyzer":
     if st.button("Analyze Post"):
         if not post_url:
             st.error("Please enter a LinkedIn post URL")
+        elif not LI_POST_RE.match(post_url.strip()):
+            st.error("Please enter a valid LinkedIn post URL, e.g. https://www.linkedin.com/posts/...")
         else:
-            analyze_post(post_url)
+            analyze_post(post_url.strip())
 
 elif choose == "Competitor Analysis":
     st.title("Competitor Profile Analysis")
@@ -375,13 +629,10 @@ elif choose == "Competitor Analysis":
     if st.button("Analyze Competitor"):
         if not all([username, password, comp_un]):
             st.error("Please fill in all required fields")
+        elif not LI_USERNAME_RE.match(comp_un.strip()):
+            st.error("Please enter only the profile username, e.g. john-doe")
         else:
-            competitor_analysis(username, password, comp_un)
+            competitor_analysis(username, password, comp_un.strip())
 
 # Footer
-st.markdown("""
-    <style>
-        footer {visibility: hidden;}
-        .stDeployButton {display:none;}
-    </style>
-""", unsafe_allow_html=True)
+st.markdown(FOOTER_CSS, unsafe_allow_html=True)